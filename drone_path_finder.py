@@ -1,4 +1,5 @@
 import heapq
+from array import array
 from collections import deque
 
 
@@ -6,143 +7,364 @@ class DronePathfinder:
     def __init__(self, grid):
         self.grid = grid
         self.rows, self.cols = len(grid), len(grid[0])
+        # One byte per cell (1 = obstacle), row-major, padded with a border
+        # of obstacles so neighbor lookups never need a bounds check
+        self._cells = ''.join(''.join(row) for row in grid)
+        self._stride = stride = self.cols + 2
+        self._wall = bytearray(b'\x01') * ((self.rows + 2) * stride)
+        for i, row in enumerate(grid, 1):
+            self._wall[i*stride + 1:(i+1)*stride - 1] = bytes(cell == 'X' for cell in row)
+        # Narrowest signed array type for node ids and path costs; costs stay
+        # below twice the cell count, so small grids get 2-byte entries
+        self._index_type = next(t for t in 'hiq'
+                                if 2 * len(self._wall) < 2 ** (8 * array(t).itemsize - 1))
+        self._unreached = 2 ** (8 * array(self._index_type).itemsize - 1) - 1
         self.start = self._find_pos('S')
         self.goal = self._find_pos('G')
         self.directions = [(-1,0), (1,0), (0,-1), (0,1)]
+        self._nbrs = self._build_neighbors()
+        self._jump_tables = None  # built on first jps() call
     
     def _find_pos(self, symbol):
-        for i in range(self.rows):
-            for j in range(self.cols):
-                if self.grid[i][j] == symbol:
-                    return (i, j)
+        idx = self._cells.find(symbol)
+        if idx >= 0:
+            return divmod(idx, self.cols)
     
-    def _is_valid(self, row, col):
-        return (0 <= row < self.rows and 0 <= col < self.cols and 
-                self.grid[row][col] != 'X')
+    def _node(self, pos):
+        return (pos[0] + 1) * self._stride + pos[1] + 1
     
-    def _get_neighbors(self, pos):
-        row, col = pos
-        return [(row+dr, col+dc) for dr, dc in self.directions 
-                if self._is_valid(row+dr, col+dc)]
+    def _pos(self, node):
+        row, col = divmod(node, self._stride)
+        return (row - 1, col - 1)
     
-    def _manhattan_dist(self, pos1, pos2):
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+    def _build_neighbors(self):
+        """Tuple of open neighbor ids for every cell, computed once per grid"""
+        wall, stride = self._wall, self._stride
+        steps = [dr * stride + dc for dr, dc in self.directions]
+        nbrs = [()] * len(wall)
+        for node in range(len(wall)):
+            # Open cells are never on the border, so node + step stays in range
+            if not wall[node]:
+                nbrs[node] = tuple(node + step for step in steps if not wall[node + step])
+        return nbrs
+    
+    def _manhattan_dist(self, node1, node2):
+        r1, c1 = divmod(node1, self._stride)
+        r2, c2 = divmod(node2, self._stride)
+        return abs(r1 - r2) + abs(c1 - c2)
+    
+    def _new_parents(self):
+        """Dense came_from table indexed by node id, -1 = no parent"""
+        return array(self._index_type, [-1]) * len(self._wall)
+    
+    def _new_scores(self, start):
+        """Dense cost table indexed by node id, _unreached = no cost yet"""
+        scores = array(self._index_type, [self._unreached]) * len(self._wall)
+        scores[start] = 0
+        return scores
     
     def _build_path(self, came_from, current):
-        path = [current]
-        while current in came_from:
+        # Decode while walking back and reverse in place: one list, no copies
+        stride, path = self._stride, []
+        while current >= 0:
+            path.append((current // stride - 1, current % stride - 1))
             current = came_from[current]
-            path.append(current)
-        return path[::-1]
+        path.reverse()
+        return path
     
     def dfs(self):
         """Depth-First Search"""
-        stack, visited, came_from, nodes = [self.start], set(), {}, 0
+        start, goal = self._node(self.start), self._node(self.goal)
+        stack, visited, came_from, nodes = [start], bytearray(len(self._wall)), self._new_parents(), 0
+        # Bind hot-loop lookups to locals once
+        push, pop, nbrs = stack.append, stack.pop, self._nbrs
         
         while stack:
-            current = stack.pop()
-            if current in visited:
+            current = pop()
+            if visited[current]:
                 continue
-            visited.add(current)
+            visited[current] = 1
             nodes += 1
             
-            if current == self.goal:
+            if current == goal:
                 return self._build_path(came_from, current), nodes
             
-            for neighbor in self._get_neighbors(current):
-                if neighbor not in visited:
-                    stack.append(neighbor)
-                    if neighbor not in came_from:
+            for neighbor in nbrs[current]:
+                if not visited[neighbor]:
+                    push(neighbor)
+                    if came_from[neighbor] < 0:
                         came_from[neighbor] = current
         return None, nodes
     
     def bfs(self):
         """Breadth-First Search"""
-        queue = deque([self.start])
-        visited = {self.start}
-        came_from, nodes = {}, 0
+        start, goal = self._node(self.start), self._node(self.goal)
+        if start == goal:
+            return self._build_path(self._new_parents(), start), 1
+        queue = deque([start])
+        visited = bytearray(len(self._wall))
+        visited[start] = 1
+        came_from, nodes = self._new_parents(), 0
+        push, pop, nbrs = queue.append, queue.popleft, self._nbrs
         
         while queue:
-            current = queue.popleft()
+            current = pop()
             nodes += 1
             
-            if current == self.goal:
-                return self._build_path(came_from, current), nodes
-            
-            for neighbor in self._get_neighbors(current):
-                if neighbor not in visited:
-                    visited.add(neighbor)
+            for neighbor in nbrs[current]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
                     came_from[neighbor] = current
-                    queue.append(neighbor)
+                    # First time the goal is reached is already a shortest path
+                    if neighbor == goal:
+                        return self._build_path(came_from, neighbor), nodes + 1
+                    push(neighbor)
+        return None, nodes
+    
+    def bibfs(self):
+        """Bidirectional Breadth-First Search"""
+        start, goal = self._node(self.start), self._node(self.goal)
+        if start == goal:
+            return self._build_path(self._new_parents(), start), 1
+        
+        size = len(self._wall)
+        dist_fwd = array(self._index_type, [-1]) * size
+        dist_bwd = array(self._index_type, [-1]) * size
+        parent_fwd, parent_bwd = self._new_parents(), self._new_parents()
+        dist_fwd[start] = dist_bwd[goal] = 0
+        frontier_fwd, frontier_bwd = [start], [goal]
+        nbrs, nodes = self._nbrs, 0
+        
+        while frontier_fwd and frontier_bwd:
+            # Grow the smaller frontier by one full level
+            forward = len(frontier_fwd) <= len(frontier_bwd)
+            if forward:
+                frontier, dist, parent, other = frontier_fwd, dist_fwd, parent_fwd, dist_bwd
+            else:
+                frontier, dist, parent, other = frontier_bwd, dist_bwd, parent_bwd, dist_fwd
+            
+            next_level, best, meet = [], -1, None
+            for current in frontier:
+                nodes += 1
+                d = dist[current] + 1
+                for neighbor in nbrs[current]:
+                    if other[neighbor] >= 0 and (best < 0 or d + other[neighbor] < best):
+                        best, meet = d + other[neighbor], (current, neighbor)
+                    if dist[neighbor] < 0:
+                        dist[neighbor] = d
+                        parent[neighbor] = current
+                        next_level.append(neighbor)
+            
+            if meet:
+                # Splice start -> meeting edge -> goal
+                u, v = meet if forward else meet[::-1]
+                tail = [v]
+                while parent_bwd[v] >= 0:
+                    v = parent_bwd[v]
+                    tail.append(v)
+                return self._build_path(parent_fwd, u) + [self._pos(n) for n in tail], nodes
+            
+            if forward:
+                frontier_fwd = next_level
+            else:
+                frontier_bwd = next_level
         return None, nodes
     
     def ucs(self):
         """Uniform Cost Search"""
-        heap = [(0, self.start)]
-        visited, came_from, cost, nodes = set(), {}, {self.start: 0}, 0
+        start, goal = self._node(self.start), self._node(self.goal)
+        if start == goal:
+            return self._build_path(self._new_parents(), start), 1
+        # Bucket queue: edge costs are small integers, so buckets[c] holds
+        # every frontier node with cost c and pops are O(1). With unit costs
+        # a node's first cost is final, so each node is queued exactly once
+        buckets, curr_cost = [deque([start])], 0
+        came_from, cost = self._new_parents(), self._new_scores(start)
+        nodes, nbrs = 0, self._nbrs
         
-        while heap:
-            curr_cost, current = heapq.heappop(heap)
-            if current in visited:
+        while curr_cost < len(buckets):
+            bucket = buckets[curr_cost]
+            if not bucket:
+                curr_cost += 1
                 continue
-            visited.add(current)
+            current = bucket.popleft()
             nodes += 1
             
-            if current == self.goal:
-                return self._build_path(came_from, current), nodes
-            
-            for neighbor in self._get_neighbors(current):
-                new_cost = curr_cost + 1
-                if neighbor not in cost or new_cost < cost[neighbor]:
+            new_cost = curr_cost + 1
+            for neighbor in nbrs[current]:
+                if new_cost < cost[neighbor]:
                     cost[neighbor] = new_cost
                     came_from[neighbor] = current
-                    heapq.heappush(heap, (new_cost, neighbor))
+                    # Unit edge costs: the goal's first cost is final
+                    if neighbor == goal:
+                        return self._build_path(came_from, neighbor), nodes + 1
+                    if new_cost == len(buckets):
+                        buckets.append(deque())
+                    buckets[new_cost].append(neighbor)
         return None, nodes
     
     def a_star(self):
         """A* Search with Manhattan distance"""
-        heap = [(0, self.start)]
-        visited, came_from, g_score, nodes = set(), {}, {self.start: 0}, 0
+        start, goal = self._node(self.start), self._node(self.goal)
+        heap = [start]  # keys are (priority << 32) | node
+        visited, came_from = bytearray(len(self._wall)), self._new_parents()
+        g_score, nodes = self._new_scores(start), 0
+        heappush, heappop = heapq.heappush, heapq.heappop
+        nbrs, stride = self._nbrs, self._stride
+        # Heuristic is inlined below; goal coordinates are decoded once
+        goal_row, goal_col = divmod(goal, stride)
         
         while heap:
-            _, current = heapq.heappop(heap)
-            if current in visited:
+            current = heappop(heap) & 0xFFFFFFFF
+            if visited[current]:
                 continue
-            visited.add(current)
+            visited[current] = 1
             nodes += 1
             
-            if current == self.goal:
+            if current == goal:
                 return self._build_path(came_from, current), nodes
             
-            for neighbor in self._get_neighbors(current):
-                tentative_g = g_score[current] + 1
-                if neighbor not in g_score or tentative_g < g_score[neighbor]:
+            tentative_g = g_score[current] + 1
+            for neighbor in nbrs[current]:
+                if tentative_g < g_score[neighbor]:
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g
+                    row, col = divmod(neighbor, stride)
+                    f_score = tentative_g + abs(goal_row - row) + abs(goal_col - col)
+                    heappush(heap, (f_score << 32) | neighbor)
+        return None, nodes
+    
+    def _build_jump_tables(self):
+        """JPS+ tables per step: open run length and first goal-independent jump point"""
+        wall, stride, size = self._wall, self._stride, len(self._wall)
+        runs, points = {}, {}
+        # Horizontal steps first, vertical jump points are defined by them
+        for step in (1, -1, stride, -stride):
+            side = stride if step in (1, -1) else 1
+            run = array(self._index_type, [0]) * size
+            point = array(self._index_type, [-1]) * size
+            east, west = points.get(1), points.get(-1)
+            # Sweep against the step so the cell ahead is always filled in first
+            for node in (range(size - 1, -1, -1) if step > 0 else range(size)):
+                ahead = node + step
+                if wall[node] or wall[ahead]:
+                    continue
+                run[node] = run[ahead] + 1
+                # Forced neighbor: open side cell whose predecessor is blocked;
+                # vertical runs also stop wherever a horizontal jump exists
+                if ((not wall[ahead-side] and wall[ahead-side-step]) or
+                        (not wall[ahead+side] and wall[ahead+side-step]) or
+                        (side == 1 and (east[ahead] >= 0 or west[ahead] >= 0))):
+                    point[node] = ahead
+                else:
+                    point[node] = point[ahead]
+            runs[step], points[step] = run, point
+        return runs, points
+    
+    def jps(self):
+        """Jump Point Search (A* over JPS+ jump points, 4-connected)"""
+        start, goal = self._node(self.start), self._node(self.goal)
+        heap = [start]  # keys are (priority << 32) | node
+        stride = self._stride
+        closed, came_from = bytearray(len(self._wall)), self._new_parents()
+        g_score, nodes = self._new_scores(start), 0
+        heappush, heappop = heapq.heappush, heapq.heappop
+        if self._jump_tables is None:
+            self._jump_tables = self._build_jump_tables()
+        runs, points = self._jump_tables
+        goal_row, goal_col = divmod(goal, stride)
+        
+        while heap:
+            current = heappop(heap) & 0xFFFFFFFF
+            if closed[current]:
+                continue
+            closed[current] = 1
+            nodes += 1
+            
+            if current == goal:
+                # Fill in the straight runs between consecutive jump points
+                path = self._build_path(came_from, current)
+                full = [path[0]]
+                for r1, c1 in path[1:]:
+                    r0, c0 = full[-1]
+                    dr, dc = (r1 > r0) - (r1 < r0), (c1 > c0) - (c1 < c0)
+                    while (r0, c0) != (r1, c1):
+                        r0, c0 = r0 + dr, c0 + dc
+                        full.append((r0, c0))
+                return full, nodes
+            
+            row, col = divmod(current, stride)
+            parent = came_from[current]
+            if parent < 0:
+                steps = (-stride, stride, -1, 1)
+            else:
+                # Prune: continue forward or turn, never step back toward the parent
+                diff = current - parent
+                if -stride < diff < stride:
+                    steps = (1 if diff > 0 else -1, -stride, stride)
+                else:
+                    steps = (stride if diff > 0 else -stride, -1, 1)
+            
+            for step in steps:
+                run = runs[step][current]
+                if not run:
+                    continue
+                # Nearest of the table's jump point and the goal-dependent stop:
+                # the goal itself or, on a vertical run, the cell in the goal's
+                # row from which a horizontal jump reaches it
+                neighbor, length = points[step][current], 0
+                if neighbor >= 0:
+                    length = (neighbor - current) // step
+                if step == 1 or step == -1:
+                    ahead = (goal_col - col) * step if row == goal_row else 0
+                    stop = goal
+                else:
+                    ahead = (goal_row - row) * (1 if step > 0 else -1)
+                    stop = current + ahead * step
+                    if 0 < ahead <= run and stop != goal:
+                        toward = 1 if goal > stop else -1
+                        if abs(goal - stop) > runs[toward][stop]:
+                            ahead = 0
+                if 0 < ahead <= run and (neighbor < 0 or ahead < length):
+                    neighbor, length = stop, ahead
+                if neighbor < 0 or closed[neighbor]:
+                    continue
+                
+                tentative_g = g_score[current] + length
+                if tentative_g < g_score[neighbor]:
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g
-                    f_score = tentative_g + self._manhattan_dist(neighbor, self.goal)
-                    heapq.heappush(heap, (f_score, neighbor))
+                    n_row, n_col = divmod(neighbor, stride)
+                    f_score = tentative_g + abs(goal_row - n_row) + abs(goal_col - n_col)
+                    heappush(heap, (f_score << 32) | neighbor)
         return None, nodes
     
     def greedy(self):
         """Greedy Best-First Search"""
-        heap = [(self._manhattan_dist(self.start, self.goal), self.start)]
-        visited, came_from, nodes = set(), {}, 0
+        start, goal = self._node(self.start), self._node(self.goal)
+        heap = [(self._manhattan_dist(start, goal) << 32) | start]  # (priority << 32) | node
+        came_from, nodes = self._new_parents(), 0
+        # A node's heuristic never changes, so push each node only once
+        seen = bytearray(len(self._wall))
+        seen[start] = 1
+        heappush, heappop = heapq.heappush, heapq.heappop
+        nbrs, stride = self._nbrs, self._stride
+        goal_row, goal_col = divmod(goal, stride)
         
         while heap:
-            _, current = heapq.heappop(heap)
-            if current in visited:
-                continue
-            visited.add(current)
+            current = heappop(heap) & 0xFFFFFFFF
             nodes += 1
             
-            if current == self.goal:
+            if current == goal:
                 return self._build_path(came_from, current), nodes
             
-            for neighbor in self._get_neighbors(current):
-                if neighbor not in visited:
+            for neighbor in nbrs[current]:
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
                     came_from[neighbor] = current
-                    h = self._manhattan_dist(neighbor, self.goal)
-                    heapq.heappush(heap, (h, neighbor))
+                    row, col = divmod(neighbor, stride)
+                    h = abs(goal_row - row) + abs(goal_col - col)
+                    heappush(heap, (h << 32) | neighbor)
         return None, nodes
 
 
@@ -151,38 +373,47 @@ def validate_grid(grid):
     if not grid or not grid[0]:
         return False, "Empty grid"
     
-    # Check equal row lengths and valid symbols
+    # Rows are checked in order, so a bad symbol in an earlier row is
+    # reported before a later row with the wrong length
     cols = len(grid[0])
-    s_count = g_count = 0
+    bad_row = next((i for i, row in enumerate(grid) if len(row) != cols), len(grid))
     
-    for row in grid:
-        if len(row) != cols:
-            return False, "Unequal row lengths"
-        for cell in row:
-            if cell not in 'X.SG':
-                return False, f"Invalid symbol: {cell}"
-            if cell == 'S': s_count += 1
-            elif cell == 'G': g_count += 1
+    # Check symbols and count S/G with C-level string ops over all cells
+    cells = ''.join(''.join(row) for row in grid[:bad_row])
+    invalid = cells.translate(str.maketrans('', '', 'X.SG'))
+    if invalid:
+        return False, f"Invalid symbol: {invalid[0]}"
+    if bad_row < len(grid):
+        return False, "Unequal row lengths"
     
-    if s_count != 1: return False, "Need exactly one S"
-    if g_count != 1: return False, "Need exactly one G"
+    if cells.count('S') != 1: return False, "Need exactly one S"
+    if cells.count('G') != 1: return False, "Need exactly one G"
     return True, "Valid"
 
 
 def show_grid(grid, path=None):
     """Display grid with optional path"""
-    display = [row[:] for row in grid]
+    display = [list(row) for row in grid]
     if path:
         for r, c in path:
             if display[r][c] not in 'SG':
                 display[r][c] = '*'
     
-    print("\nGrid:")
-    for row in display:
-        print(' '.join('■' if cell == 'X' else cell for cell in row))
+    # Render the whole board as one string and print it in one call
+    board = '\n'.join(' '.join(row) for row in display).replace('X', '■')
+    print(f"\nGrid:\n{board}")
     print("Legend: S=Start, G=Goal, ■=Obstacle, *=Path, .=Open")
 
 
+def compare_algorithms(pathfinder, algorithms):
+    """Run every algorithm on the same pathfinder and print a summary table"""
+    print("\n=== Comparison ===")
+    print(f"{'Algorithm':<20}{'Nodes':>8}{'Length':>8}")
+    for name, method in algorithms.values():
+        path, nodes = getattr(pathfinder, method)()
+        print(f"{name:<20}{nodes:>8}{len(path) if path else '-':>8}")
+
+
 def get_grid():
     """Get grid from user (preset or custom)"""
     presets = {
@@ -214,7 +445,8 @@ def main():
     """Main program"""
     print("=== Drone Pathfinding System ===")
     algorithms = {1: ("DFS", "dfs"), 2: ("BFS", "bfs"), 3: ("UCS", "ucs"), 
-                  4: ("A*", "a_star"), 5: ("Greedy", "greedy")}
+                  4: ("A*", "a_star"), 5: ("Greedy", "greedy"),
+                  6: ("Bidirectional BFS", "bibfs"), 7: ("Jump Point Search", "jps")}
     
     while True:
         try:
@@ -226,38 +458,46 @@ def main():
                 continue
             
             show_grid(grid)
-            
-            # Choose algorithm
-            print("\nAlgorithms:")
-            for i, (name, _) in algorithms.items():
-                print(f"{i}. {name}")
-            
-            algo_num = int(input("Choose (1-5): "))
-            if algo_num not in algorithms:
-                print("Invalid choice!")
-                continue
-            
-            # Run pathfinding
-            algo_name, method = algorithms[algo_num]
+            # Built once per grid and reused for every algorithm run on it
             pathfinder = DronePathfinder(grid)
-            path, nodes = getattr(pathfinder, method)()
             
-            # Show results
-            print(f"\n=== {algo_name} Results ===")
-            print(f"Nodes explored: {nodes}")
-            if path:
-                print(f"Path found! Length: {len(path)} steps")
-                print(f"Route: {' → '.join(f'({r},{c})' for r,c in path)}")
-                show_grid(grid, path)
-            else:
-                print("No path exists!")
+            while True:
+                # Choose algorithm
+                print("\nAlgorithms:")
+                for i, (name, _) in algorithms.items():
+                    print(f"{i}. {name}")
+                print("0. Compare all")
+                
+                algo_num = int(input(f"Choose (0-{len(algorithms)}): "))
+                if algo_num == 0:
+                    compare_algorithms(pathfinder, algorithms)
+                elif algo_num not in algorithms:
+                    print("Invalid choice!")
+                    continue
+                else:
+                    # Run pathfinding
+                    algo_name, method = algorithms[algo_num]
+                    path, nodes = getattr(pathfinder, method)()
+                    
+                    # Show results
+                    print(f"\n=== {algo_name} Results ===")
+                    print(f"Nodes explored: {nodes}")
+                    if path:
+                        print(f"Path found! Length: {len(path)} steps")
+                        print(f"Route: {' → '.join(f'({r},{c})' for r,c in path)}")
+                        show_grid(grid, path)
+                    else:
+                        print("No path exists!")
+                
+                if input("\nRun another algorithm on this grid? (y/n): ").lower() != 'y':
+                    break
             
         except (ValueError, KeyboardInterrupt):
             print("Invalid input!")
         except Exception as e:
             print(f"Error: {e}")
         
-        if input("\nTry again? (y/n): ").lower() != 'y':
+        if input("\nTry another grid? (y/n): ").lower() != 'y':
             break
     
     print("Goodbye!")